@@ -0,0 +1,62 @@
+"""
+Optional igraph backend.
+
+igraph runs graph algorithms in its C core, which is several times faster
+than NetworkX for all-pairs distances on graphs this size. NetworkX stays
+the API-facing object everywhere; these helpers only convert for the
+heavy computation and map results back to node labels.
+"""
+import networkx as nx
+import numpy as np
+
+try:
+    import igraph as ig
+    HAS_IGRAPH = True
+except ImportError:
+    HAS_IGRAPH = False
+
+
+def nx_to_igraph(G: nx.Graph) -> "ig.Graph":
+    """
+    Convert a weighted NetworkX graph to igraph.Graph.
+    Vertex i corresponds to list(G.nodes)[i]; names are kept in vs['name']
+    and edge weights in es['weight'].
+    """
+    if not HAS_IGRAPH:
+        raise ImportError("python-igraph is not installed")
+
+    nodes = list(G.nodes)
+    node_idx = {node: i for i, node in enumerate(nodes)}
+
+    g = ig.Graph(
+        n=len(nodes),
+        edges=[(node_idx[u], node_idx[v]) for u, v in G.edges()],
+        directed=False,
+    )
+    g.vs["name"] = nodes
+    g.es["weight"] = [data.get("weight", 1.0)
+                      for _, _, data in G.edges(data=True)]
+    return g
+
+
+def all_pairs_distance_stats(G: nx.Graph) -> dict:
+    """
+    Min/max/mean over all finite shortest-path distances between distinct
+    node pairs. igraph returns the full (N, N) distance matrix from C;
+    the statistics are then one NumPy pass over its upper triangle.
+    """
+    g = nx_to_igraph(G)
+    dist = np.asarray(g.distances(weights="weight"))
+
+    iu = np.triu_indices(dist.shape[0], k=1)
+    values = dist[iu]
+    values = values[np.isfinite(values)]
+    if not values.size:
+        return {"min": 0.0, "max": 0.0, "mean": 0.0, "pairs": 0}
+
+    return {
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "mean": float(values.mean()),
+        "pairs": int(values.size),
+    }
@@ -2,8 +2,64 @@ from pathlib import Path
 import pandas as pd
 import zipfile
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 HVV_DATA = "data/HVV"
 
+if HAS_PYARROW:
+    # Explicit schemas for the columns we rely on: no dtype inference,
+    # ids stay strings, coordinates/sequences get fixed numeric types.
+    _GTFS_COLUMN_TYPES = {
+        "stops": {
+            "stop_id": pa.string(),
+            "stop_name": pa.string(),
+            "stop_lat": pa.float64(),
+            "stop_lon": pa.float64(),
+        },
+        "routes": {
+            "route_id": pa.string(),
+            "route_short_name": pa.string(),
+            "route_long_name": pa.string(),
+            "route_color": pa.string(),
+            "route_type": pa.int32(),
+        },
+        "trips": {
+            "trip_id": pa.string(),
+            "route_id": pa.string(),
+            "service_id": pa.string(),
+        },
+        "stop_times": {
+            "trip_id": pa.string(),
+            "stop_id": pa.string(),
+            "stop_sequence": pa.int32(),
+            "arrival_time": pa.string(),
+            "departure_time": pa.string(),
+        },
+    }
+
+
+def _read_gtfs_csv(path: Path, name: str) -> pd.DataFrame:
+    """
+    Read one GTFS table. Uses pyarrow's multi-threaded block-parallel CSV
+    reader with an explicit schema when pyarrow is installed, otherwise
+    falls back to pandas.
+    """
+    if HAS_PYARROW:
+        table = pa_csv.read_csv(
+            str(path),
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=16 << 20),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=_GTFS_COLUMN_TYPES.get(name, {})
+            ),
+        )
+        return table.to_pandas()
+    return pd.read_csv(path, low_memory=False)
+
 
 def _extract_data_if_needed(gtfs_dir: Path):
     """
@@ -47,5 +103,5 @@ def load_gtfs_tables(gtfs_dir: str | Path) -> dict[str, pd.DataFrame]:
         path = gtfs_dir / f"{name}.txt"
         if not path.exists():
             raise FileNotFoundError(f"Required GTFS file not found: {path}")
-        tables[name] = pd.read_csv(path, low_memory=False)
+        tables[name] = _read_gtfs_csv(path, name)
     return tables
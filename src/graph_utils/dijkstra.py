@@ -1,5 +1,26 @@
-import networkx as nx
 import heapq
+import os
+from dataclasses import dataclass
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra as csgraph_dijkstra
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    from joblib import Parallel, delayed
+    HAS_JOBLIB = True
+except ImportError:
+    HAS_JOBLIB = False
+
+# below this size one multi-source scipy call beats spawning workers
+_PARALLEL_MIN_NODES = 1000
 
 def geographic_distance(G: nx.Graph, u: str, v: str) -> float:
     """
@@ -7,12 +28,20 @@ def geographic_distance(G: nx.Graph, u: str, v: str) -> float:
     Returns distance in kilometers.
     """
     from math import radians, sin, cos, sqrt, atan2
-    
-    u_lat = G.nodes[u]['lat']
-    u_lon = G.nodes[u]['lon']
-    v_lat = G.nodes[v]['lat']
-    v_lon = G.nodes[v]['lon']
-    
+
+    node_index = G.graph.get('node_index')
+    if node_index is not None:
+        # SoA columns from graph build: contiguous array loads
+        iu, iv = node_index[u], node_index[v]
+        lat_arr, lon_arr = G.graph['lat'], G.graph['lon']
+        u_lat, u_lon = lat_arr[iu], lon_arr[iu]
+        v_lat, v_lon = lat_arr[iv], lon_arr[iv]
+    else:
+        u_lat = G.nodes[u]['lat']
+        u_lon = G.nodes[u]['lon']
+        v_lat = G.nodes[v]['lat']
+        v_lon = G.nodes[v]['lon']
+
     # Haversine formula for great-circle distance
     R = 6371  # Earth radius in km
     lat1, lon1 = radians(u_lat), radians(u_lon)
@@ -30,46 +59,419 @@ def travel_time_weight(G: nx.Graph, u: str, v: str) -> float:
     """
     Get travel time between two nodes from edge attributes.
     """
+    edge_index = G.graph.get('edge_index')
+    if edge_index is not None:
+        # precomputed per-edge minimum: a single array gather
+        k = edge_index.get((u, v))
+        if k is not None:
+            return float(G.graph['min_travel_time'][k])
+        return 60  # default 1 minute
     if G.has_edge(u, v):
-        travel_times = G[u][v].get("travel_time", [])
+        attrs = G[u][v]
+        if "min_travel_time" in attrs:
+            return attrs["min_travel_time"]  # precomputed at graph build
+        travel_times = attrs.get("travel_time", [])
         if travel_times:
             return min(travel_times)  # minimum time
     return 60  # default 1 minute
 
+@dataclass
+class EdgeTable:
+    """
+    Immutable SoA view of the graph's edges, built once per graph and
+    cached on G.graph['_edge_table']. Weight columns are filled lazily.
+    """
+    nodes: list
+    node_index: dict
+    edges: list
+    u_idx: np.ndarray
+    v_idx: np.ndarray
+    geo_weight: np.ndarray | None = None
+    time_weight: np.ndarray | None = None
+
+def _edge_table(G: nx.Graph) -> EdgeTable:
+    """
+    Return the cached EdgeTable for the graph, building it on first use.
+    Reuses the SoA columns attached by build_hvv_graph when present.
+    """
+    table = G.graph.get('_edge_table')
+    if table is not None:
+        return table
+
+    nodes = list(G.nodes())
+    node_index = G.graph.get('node_index') or {node: i for i, node in enumerate(nodes)}
+    edges = list(G.edges())
+    m = len(edges)
+
+    if 'edge_u_idx' in G.graph:
+        u_idx = G.graph['edge_u_idx'].astype(np.int64)
+        v_idx = G.graph['edge_v_idx'].astype(np.int64)
+    else:
+        u_idx = np.fromiter((node_index[u] for u, _ in edges), dtype=np.int64, count=m)
+        v_idx = np.fromiter((node_index[v] for _, v in edges), dtype=np.int64, count=m)
+
+    table = EdgeTable(nodes=nodes, node_index=node_index, edges=edges,
+                      u_idx=u_idx, v_idx=v_idx)
+    G.graph['_edge_table'] = table
+    return table
+
+def _edge_geo_weights(G: nx.Graph) -> np.ndarray:
+    """
+    Haversine distances (km) for all edges in one NumPy pass, cached on
+    the EdgeTable.
+    """
+    table = _edge_table(G)
+    if table.geo_weight is not None:
+        return table.geo_weight
+
+    n = len(table.nodes)
+    if 'lat' in G.graph:
+        lat, lon = G.graph['lat'], G.graph['lon']
+    else:
+        lat = np.fromiter((G.nodes[node]['lat'] for node in table.nodes),
+                          dtype=np.float64, count=n)
+        lon = np.fromiter((G.nodes[node]['lon'] for node in table.nodes),
+                          dtype=np.float64, count=n)
+
+    # Haversine formula over full edge arrays
+    R = 6371  # Earth radius in km
+    lat1, lon1 = np.radians(lat[table.u_idx]), np.radians(lon[table.u_idx])
+    lat2, lon2 = np.radians(lat[table.v_idx]), np.radians(lon[table.v_idx])
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+    table.geo_weight = 2 * R * np.arcsin(np.sqrt(a))
+    return table.geo_weight
+
+def _edge_time_weights(G: nx.Graph) -> np.ndarray:
+    """
+    Minimum travel time (seconds) per edge, cached on the EdgeTable.
+    """
+    table = _edge_table(G)
+    if table.time_weight is not None:
+        return table.time_weight
+
+    if 'min_travel_time' in G.graph:
+        table.time_weight = np.asarray(G.graph['min_travel_time'], dtype=np.float64)
+    else:
+        table.time_weight = np.fromiter(
+            (G[u][v].get('min_travel_time',
+                         min(tt) if (tt := G[u][v].get('travel_time')) else 60)
+             for u, v in table.edges),
+            dtype=np.float64, count=len(table.edges))
+    return table.time_weight
+
 def add_edge_weights(G: nx.Graph, weight_func, weight_type: str = "geographic") -> nx.Graph:
     """
     Add weights to the edges of the graph.
-    
+
     Args:
         G: Graph
         weight_func: Function to calculate weight (geographic_distance or travel_time_weight)
         weight_type: "geographic" or "time"
     """
-    for u, v in G.edges():
-        if weight_type == "geographic":
-            G[u][v]['weight'] = weight_func(G, u, v)
-        elif weight_type == "time":
-            # use saved time from edges
-            travel_times = G[u][v].get("travel_time", [])
-            if travel_times:
-                # can take minimum, average or first value
-                G[u][v]['weight'] = min(travel_times)  # or sum(travel_times) / len(travel_times)
-            else:
-                G[u][v]['weight'] = 60  # default 1 minute
+    G.graph.pop('_csr', None)  # weights change, drop the cached CSR
+
+    # both weight types come precomputed from the shared edge table
+    table = _edge_table(G)
+    if weight_type == "geographic":
+        weights = _edge_geo_weights(G)
+    elif weight_type == "time":
+        weights = _edge_time_weights(G)
+    else:
+        return G
+
+    nx.set_edge_attributes(G, dict(zip(table.edges, weights.tolist())), 'weight')
     return G
 
+# Floor for stored edge weights: scipy's csgraph routines treat zero (and
+# unstored) entries as missing edges, so zero-weight edges are clamped to a
+# value far below any real distance/time instead of being dropped.
+_MIN_EDGE_WEIGHT = 1e-9
+
+def _graph_csr(G: nx.Graph) -> tuple:
+    """
+    Return symmetric CSR arrays (indptr, indices, weights, nodes, node_to_idx)
+    for the graph, cached on G.graph['_csr'] so repeated queries skip the
+    conversion. Both edge orientations are mirrored directly from the edge
+    arrays; summing csr + csr.T would cancel explicitly-stored zeros and
+    silently delete zero-weight edges.
+    """
+    cached = G.graph.get('_csr')
+    if cached is not None:
+        return cached
+
+    table = _edge_table(G)
+    n = len(table.nodes)
+    m = len(table.edges)
+
+    # one pass over edge weights; endpoint indices come from the table
+    data = np.fromiter((G[u][v].get('weight', 1) for u, v in table.edges),
+                       dtype=np.float64, count=m)
+    data = np.maximum(data, _MIN_EDGE_WEIGHT)
+
+    sym = csr_matrix(
+        (np.concatenate([data, data]),
+         (np.concatenate([table.u_idx, table.v_idx]),
+          np.concatenate([table.v_idx, table.u_idx]))),
+        shape=(n, n))
+    cached = (sym.indptr.astype(np.int64), sym.indices.astype(np.int64),
+              sym.data, table.nodes, table.node_index)
+    G.graph['_csr'] = cached
+    return cached
+
+def _structure_csr(G: nx.Graph) -> tuple:
+    """
+    Symmetric CSR of the graph structure with unit weights, for unweighted
+    traversals (BFS/DFS). Unlike _graph_csr it does not depend on whatever
+    edge weights were last assigned, so it is cached separately on
+    G.graph['_csr_structure'] and never invalidated by add_edge_weights.
+    """
+    cached = G.graph.get('_csr_structure')
+    if cached is not None:
+        return cached
+
+    table = _edge_table(G)
+    n = len(table.nodes)
+    m = len(table.edges)
+
+    sym = csr_matrix(
+        (np.ones(2 * m),
+         (np.concatenate([table.u_idx, table.v_idx]),
+          np.concatenate([table.v_idx, table.u_idx]))),
+        shape=(n, n))
+    cached = (sym.indptr.astype(np.int64), sym.indices.astype(np.int64),
+              sym.data, table.nodes, table.node_index)
+    G.graph['_csr_structure'] = cached
+    return cached
+
+def _dijkstra_csr_into(indptr, indices, weights, start, end, dist, pred):
+    """
+    Single-source Dijkstra on CSR arrays with an early exit at `end`,
+    writing into caller-provided dist (pre-filled inf) and pred
+    (pre-filled -1) buffers. Compiled with numba when available; pass
+    end=-1 for a full SSSP.
+    """
+    dist[start] = 0.0
+    heap = [(0.0, start)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u == end:
+            break
+        if d > dist[u]:
+            continue  # stale heap entry
+        for e in range(indptr[u], indptr[u + 1]):
+            v = indices[e]
+            new_dist = d + weights[e]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                pred[v] = u
+                heapq.heappush(heap, (new_dist, v))
+
+if HAS_NUMBA:
+    _dijkstra_csr_into = numba.njit(cache=True)(_dijkstra_csr_into)
+
+def _dijkstra_csr(indptr, indices, weights, start, end):
+    """
+    Allocating wrapper around _dijkstra_csr_into. Returns (dist, pred).
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int32)
+    _dijkstra_csr_into(indptr, indices, weights, start, end, dist, pred)
+    return dist, pred
+
+class DijkstraContext:
+    """
+    Reusable buffers for many single-pair queries on one weighted graph.
+    The distance/predecessor arrays are allocated once and refilled
+    between queries, so the hot loop allocates nothing per call.
+    """
+
+    def __init__(self, G: nx.Graph):
+        self.indptr, self.indices, self.weights, self.nodes, self.node_to_idx = _graph_csr(G)
+        n = len(self.nodes)
+        self._dist = np.empty(n, dtype=np.float64)
+        self._pred = np.empty(n, dtype=np.int32)
+
+    def shortest_path(self, start, end) -> tuple[list, float]:
+        """
+        Same contract as dijkstra_shortest_path, reusing the buffers.
+        """
+        start_idx = self.node_to_idx[start]
+        end_idx = self.node_to_idx[end]
+
+        self._dist.fill(np.inf)
+        self._pred.fill(-1)
+        _dijkstra_csr_into(self.indptr, self.indices, self.weights,
+                           start_idx, end_idx, self._dist, self._pred)
+
+        if np.isinf(self._dist[end_idx]):
+            return None, float('inf')
+        path = _reconstruct_path(self._pred, self.nodes, start_idx, end_idx)
+        return path, float(self._dist[end_idx])
+
+def _reconstruct_path(predecessors, nodes, start_idx, end_idx) -> list | None:
+    """
+    Walk a scipy predecessor row back from end_idx to start_idx.
+    Returns the path as a list of node labels, or None if unreachable.
+    """
+    path = []
+    current = end_idx
+    while current != start_idx:
+        if current < 0:  # scipy marks unreachable nodes with -9999
+            return None
+        path.append(nodes[current])
+        current = predecessors[current]
+    path.append(nodes[start_idx])
+    path.reverse()
+    return path
+
 def dijkstra_shortest_path(G, start, end) -> tuple[list, float]:
     """
     Find the shortest path between two nodes using Dijkstra's algorithm.
+    Runs the numba-compiled CSR kernel when numba is installed, otherwise
+    falls back to scipy's compiled implementation.
+    """
+    indptr, indices, weights, nodes, node_to_idx = _graph_csr(G)
+    start_idx = node_to_idx[start]
+    end_idx = node_to_idx[end]
+
+    if HAS_NUMBA:
+        distances, predecessors = _dijkstra_csr(indptr, indices, weights,
+                                                start_idx, end_idx)
+    else:
+        csr = csr_matrix((weights, indices, indptr),
+                         shape=(len(nodes), len(nodes)))
+        distances, predecessors = csgraph_dijkstra(
+            csr, directed=True, indices=start_idx, return_predecessors=True
+        )
+
+    if np.isinf(distances[end_idx]):
+        # no path found
+        return None, float('inf')
+
+    path = _reconstruct_path(predecessors, nodes, start_idx, end_idx)
+    return path, float(distances[end_idx])
+
+def dijkstra_bucket_queue(G, start, end, delta: float | None = None) -> tuple[list, float]:
+    """
+    Dijkstra with a monotone bucket queue (delta-stepping style) instead of
+    a binary heap. Transit edge weights sit in a narrow bounded range, so
+    bucketing tentative distances by `delta` makes every push/pop O(1) and
+    drops the heap's log factor. A node improved within its own bucket is
+    simply re-scanned before the bucket empties.
+
+    delta defaults to the median edge weight. Same return contract as
+    dijkstra_shortest_path.
     """
-    # initialize distances and predecessors
-    distances = {node: float('inf') for node in G.nodes()}
-    predecessors = {node: None for node in G.nodes()}
-    distances[start] = 0
-    queue = [(0, start)]
+    from collections import deque
+
+    if delta is None:
+        weights = [attrs.get('weight', 1) for _, _, attrs in G.edges(data=True)]
+        delta = float(np.median(weights)) if weights else 1.0
+    if delta <= 0:
+        delta = 1.0
+
+    distances = {start: 0.0}
+    predecessors = {start: None}
+    buckets = [deque([start])]
+    processed_at = {}  # node -> distance it was last relaxed from
+
+    b = 0
+    while b < len(buckets):
+        queue = buckets[b]
+        while queue:
+            current_node = queue.popleft()
+            current_distance = distances[current_node]
+            # skip entries already relaxed from this (or a better) distance
+            if processed_at.get(current_node) == current_distance:
+                continue
+            processed_at[current_node] = current_distance
+
+            for neighbor, attrs in G[current_node].items():
+                new_distance = current_distance + attrs.get('weight', 1)
+                if new_distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = new_distance
+                    predecessors[neighbor] = current_node
+                    idx = int(new_distance / delta)
+                    while idx >= len(buckets):
+                        buckets.append(deque())
+                    buckets[idx].append(neighbor)
+
+        # bucket b is empty: every distance below (b+1)*delta is final
+        if end in distances and distances[end] < (b + 1) * delta:
+            path = []
+            node = end
+            while node is not None:
+                path.append(node)
+                node = predecessors[node]
+            path.reverse()
+            return path, distances[end]
+        b += 1
+
+    # no path found
+    return None, float('inf')
+
+_MAX_SPEED_KMH = 80  # fallback speed bound when the graph carries no time data
+
+def _max_edge_speed(G) -> float:
+    """
+    Fastest observed edge speed (km/h) over the graph's schedule, cached on
+    G.graph['_max_edge_speed']. Zero travel times are skipped (the GTFS
+    minute granularity produces them), so the bound covers every edge with
+    a measurable speed.
+    """
+    speed = G.graph.get('_max_edge_speed')
+    if speed is None:
+        geo = _edge_geo_weights(G)
+        times = _edge_time_weights(G)
+        mask = times > 0
+        if mask.any():
+            speed = max(float((geo[mask] / times[mask]).max() * 3600),
+                        _MAX_SPEED_KMH)
+        else:
+            speed = float(_MAX_SPEED_KMH)
+        G.graph['_max_edge_speed'] = speed
+    return speed
+
+def astar_shortest_path(G, start, end, weight_type: str = "geographic") -> tuple[list, float]:
+    """
+    A* shortest path with the Haversine great-circle distance to `end` as
+    the heuristic, keeping the search inside a narrow ellipse between the
+    endpoints. For "geographic" weights the heuristic never overestimates,
+    so results match Dijkstra exactly. For "time" weights it is scaled by
+    the fastest edge speed observed in the schedule; zero-duration hops in
+    the GTFS data (minute granularity) admit no finite speed bound, so
+    time-weighted results may be marginally above the true optimum on
+    paths through such hops.
+    """
+    from math import radians, sin, cos, asin, sqrt
+
+    R = 6371  # Earth radius in km
+    end_data = G.nodes[end]
+    end_lat = end_data.get('lat_rad', radians(end_data['lat']))
+    end_lon = end_data.get('lon_rad', radians(end_data['lon']))
+    max_speed = _max_edge_speed(G) if weight_type == "time" else None
+
+    def heuristic(node) -> float:
+        data = G.nodes[node]
+        lat = data.get('lat_rad', radians(data['lat']))
+        lon = data.get('lon_rad', radians(data['lon']))
+        a = sin((end_lat - lat) / 2)**2 + cos(lat) * cos(end_lat) * sin((end_lon - lon) / 2)**2
+        h = 2 * R * asin(sqrt(a))
+        if max_speed is not None:
+            h = h / max_speed * 3600  # km lower bound -> seconds
+        return h
+
+    distances = {start: 0.0}
+    predecessors = {start: None}
+    queue = [(heuristic(start), 0.0, start)]
 
     while queue:
-        current_distance, current_node = heapq.heappop(queue)
+        _, current_distance, current_node = heapq.heappop(queue)
         if current_node == end:
             # reconstruct path
             path = []
@@ -78,34 +480,174 @@ def dijkstra_shortest_path(G, start, end) -> tuple[list, float]:
                 current_node = predecessors[current_node]
             path.reverse()
             return path, distances[end]
+        if current_distance > distances[current_node]:
+            continue  # stale heap entry
         for neighbor, attrs in G[current_node].items():
-            weight = attrs.get('weight', 1)
-            new_distance = current_distance + weight
-            if new_distance < distances[neighbor]:
+            new_distance = current_distance + attrs.get('weight', 1)
+            if new_distance < distances.get(neighbor, float('inf')):
                 distances[neighbor] = new_distance
                 predecessors[neighbor] = current_node
-                heapq.heappush(queue, (new_distance, neighbor))
-    
+                heapq.heappush(queue, (new_distance + heuristic(neighbor),
+                                       new_distance, neighbor))
+
     # no path found
     return None, float('inf')
 
+def bidirectional_dijkstra(G, start, end) -> tuple[list, float]:
+    """
+    Find the shortest path by expanding from both endpoints at once.
+    The two frontiers meet near the middle, so roughly the square root of
+    the nodes a one-sided search would settle get touched. Same return
+    contract as dijkstra_shortest_path.
+    """
+    if start == end:
+        return [start], 0.0
+
+    # forward/backward settled distances, tentative distances and predecessors
+    settled = ({}, {})
+    tentative = ({start: 0.0}, {end: 0.0})
+    predecessors = ({start: None}, {end: None})
+    heaps = ([(0.0, start)], [(0.0, end)])
+
+    mu = float('inf')  # best path length seen so far
+    meeting_node = None
+
+    while heaps[0] and heaps[1]:
+        # frontiers have met: no shorter path can still be found
+        if heaps[0][0][0] + heaps[1][0][0] >= mu:
+            break
+
+        # expand the side with the smaller frontier distance
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        other = 1 - side
+
+        current_distance, current_node = heapq.heappop(heaps[side])
+        if current_node in settled[side]:
+            continue  # stale heap entry
+        settled[side][current_node] = current_distance
+
+        for neighbor, attrs in G[current_node].items():
+            if neighbor in settled[side]:
+                continue
+            new_distance = current_distance + attrs.get('weight', 1)
+            if new_distance < tentative[side].get(neighbor, float('inf')):
+                tentative[side][neighbor] = new_distance
+                predecessors[side][neighbor] = current_node
+                heapq.heappush(heaps[side], (new_distance, neighbor))
+            # neighbor reached from both sides: candidate shortest path
+            if neighbor in tentative[other]:
+                total = tentative[side][neighbor] + tentative[other][neighbor]
+                if total < mu:
+                    mu = total
+                    meeting_node = neighbor
+
+    if meeting_node is None:
+        # no path found
+        return None, float('inf')
+
+    # forward path to the meeting node, then the backward half reversed
+    path = []
+    node = meeting_node
+    while node is not None:
+        path.append(node)
+        node = predecessors[0][node]
+    path.reverse()
+    node = predecessors[1][meeting_node]
+    while node is not None:
+        path.append(node)
+        node = predecessors[1][node]
+    return path, mu
+
+def all_pairs_distance_stats(G) -> dict:
+    """
+    Min/max/mean shortest-path distance over all distinct node pairs,
+    taken straight from scipy's full distance matrix. No predecessors are
+    requested and no paths are reconstructed, so the whole computation is
+    one C call plus a NumPy pass over the matrix's upper triangle.
+    Returns {'min', 'max', 'mean', 'pairs'}.
+    """
+    indptr, indices, weights, nodes, _ = _graph_csr(G)
+    n = len(nodes)
+    csr = csr_matrix((weights, indices, indptr), shape=(n, n))
+    dist_matrix = csgraph_dijkstra(csr, directed=True)
+
+    values = dist_matrix[np.triu_indices(n, k=1)]
+    values = values[np.isfinite(values)]
+    if not values.size:
+        return {"min": 0.0, "max": 0.0, "mean": 0.0, "pairs": 0}
+
+    return {
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "mean": float(values.mean()),
+        "pairs": int(values.size),
+    }
+
+if HAS_NUMBA:
+    @numba.njit(cache=True, parallel=True)
+    def _all_pairs_csr(indptr, indices, weights):
+        """
+        Full distance/predecessor matrices: one Dijkstra row per source,
+        with the sources split across threads by prange. Each row writes
+        into its own slice, so the loop bodies share nothing but the
+        read-only CSR arrays.
+        """
+        n = indptr.shape[0] - 1
+        dist = np.full((n, n), np.inf)
+        pred = np.full((n, n), -1, dtype=np.int32)
+        for s in numba.prange(n):
+            # prange indices are unsigned; the kernel's heap entries are
+            # typed from `start`, so cast to match the int64 CSR indices
+            _dijkstra_csr_into(indptr, indices, weights, np.int64(s), -1,
+                               dist[s], pred[s])
+        return dist, pred
+
+def _sssp_rows(csr, sources):
+    """
+    Dijkstra distance/predecessor rows for a block of source indices.
+    Module-level so joblib workers can pickle it.
+    """
+    return csgraph_dijkstra(csr, directed=True, indices=sources,
+                            return_predecessors=True)
+
 def all_pairs_shortest_paths(G) -> dict:
     """
     Find all shortest paths between all pairs of nodes using Dijkstra's algorithm.
+    Each source row is independent, so on large graphs the sources are split
+    across joblib workers sharing one read-only CSR; small graphs use a single
+    multi-source scipy call. Paths are reconstructed from the predecessor rows.
     Returns a dictionary: {(start, end): (path, distance)}
     """
+    indptr, indices, weights, nodes, _ = _graph_csr(G)
+    n = len(nodes)
+
+    if HAS_NUMBA:
+        # threaded compiled rows: no pickling, no worker processes
+        dist_matrix, predecessors = _all_pairs_csr(indptr, indices, weights)
+    elif HAS_JOBLIB and n >= _PARALLEL_MIN_NODES:
+        csr = csr_matrix((weights, indices, indptr), shape=(n, n))
+        # ~4 chunks per core keeps the workers evenly loaded
+        n_chunks = 4 * (os.cpu_count() or 1)
+        chunks = [c for c in np.array_split(np.arange(n), n_chunks) if len(c)]
+        results = Parallel(n_jobs=-1)(
+            delayed(_sssp_rows)(csr, chunk) for chunk in chunks
+        )
+        dist_matrix = np.vstack([dist for dist, _ in results])
+        predecessors = np.vstack([pred for _, pred in results])
+    else:
+        csr = csr_matrix((weights, indices, indptr), shape=(n, n))
+        dist_matrix, predecessors = csgraph_dijkstra(
+            csr, directed=True, return_predecessors=True
+        )
+
     all_paths = {}
-    nodes = list(G.nodes())
-    total_pairs = len(nodes) * (len(nodes) - 1) // 2
-    processed = 0
-    
-    for i, start in enumerate(nodes):
-        for end in nodes[i+1:]:  # Only compute for unique pairs (start != end)
-            path, distance = dijkstra_shortest_path(G, start, end)
+    n = len(nodes)
+    for i in range(n):
+        for j in range(i + 1, n):  # Only compute for unique pairs (start != end)
+            if np.isinf(dist_matrix[i, j]):
+                continue
+            path = _reconstruct_path(predecessors[i], nodes, i, j)
             if path:  # Only add if path exists
-                all_paths[(start, end)] = (path, distance)
-            processed += 1
-            if processed % 100 == 0:
-                print(f"  Processed {processed}/{total_pairs} pairs...", end='\r')
-    
+                all_paths[(nodes[i], nodes[j])] = (path, float(dist_matrix[i, j]))
+
     return all_paths
\ No newline at end of file
@@ -1,17 +1,22 @@
 import networkx as nx
+import numpy as np
 
-def basic_graph_stats(G: nx.Graph) -> dict:
+def basic_graph_stats(G: nx.Graph, include_degrees: bool = False) -> dict:
     """
     Calculate basic statistics for the graph.
+    Degree extremes and mean come from one NumPy pass over the degree view;
+    pass include_degrees=True to also get the per-node degree dict.
     """
-    degrees = dict(G.degree())
-    degree_values = list(degrees.values()) if degrees else [0]
+    n = G.number_of_nodes()
+    degrees = np.fromiter((d for _, d in G.degree()), dtype=np.int32, count=n)
 
-    return {
-        "num_nodes": G.number_of_nodes(),
+    stats = {
+        "num_nodes": n,
         "num_edges": G.number_of_edges(),
-        "max_degree": max(degree_values),
-        "min_degree": min(degree_values),
-        "avg_degree": sum(degree_values) / len(degree_values) if degree_values else 0,
-        "degrees": degrees,
+        "max_degree": int(degrees.max()) if n else 0,
+        "min_degree": int(degrees.min()) if n else 0,
+        "avg_degree": float(degrees.mean()) if n else 0,
     }
+    if include_degrees:
+        stats["degrees"] = dict(G.degree())
+    return stats
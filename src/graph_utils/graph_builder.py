@@ -1,3 +1,7 @@
+import sys
+from math import radians
+
+import numpy as np
 import pandas as pd
 import networkx as nx
 
@@ -22,11 +26,12 @@ def build_stop_clusters(stops: pd.DataFrame, used_stop_ids: set[str]) -> tuple[p
         .rename(columns={"stop_name_clean": "node_id"})
     )
 
-    # Mapping from original stop_id to merged node_id
-    stop_id_to_node = {}
-    for _, row in clusters.iterrows():
-        for sid in row["stop_ids"]:
-            stop_id_to_node[sid] = row["node_id"]
+    # Mapping from original stop_id to merged node_id: one C-level pass
+    # over the two columns instead of nested iterrows loops. Node names are
+    # interned so every later dict/set lookup on them compares by pointer.
+    stop_id_to_node = {sid: sys.intern(name)
+                       for sid, name in zip(stops["stop_id"].to_numpy(),
+                                            stops["stop_name_clean"].to_numpy())}
 
     return clusters, stop_id_to_node
 
@@ -43,6 +48,28 @@ def parse_gtfs_time(time_str: str) -> int:
         return hours * 3600 + minutes * 60 + seconds
     return 0
 
+def gtfs_times_to_seconds(times: pd.Series) -> pd.Series:
+    """
+    Vectorized version of parse_gtfs_time for a whole column:
+    one string split over the Series instead of a Python call per row.
+    Missing or malformed values become 0.
+    """
+    parts = times.astype(str).str.split(':', expand=True)
+    if parts.shape[1] < 3:
+        return pd.Series(0, index=times.index, dtype='int32')
+    parts = parts.iloc[:, :3].apply(pd.to_numeric, errors='coerce')
+    seconds = parts.iloc[:, 0] * 3600 + parts.iloc[:, 1] * 60 + parts.iloc[:, 2]
+    return seconds.fillna(0).astype('int32')
+
+# Distinct route-id sets in a network are few, so edges share interned
+# frozensets. Consumers walking a path can then detect a route change with
+# a pointer compare before falling back to set equality. (frozenset cannot
+# be weak-referenced, so this is a plain dict rather than a weak table.)
+_route_set_intern: dict[frozenset, frozenset] = {}
+
+def _intern_route_set(route_ids: frozenset) -> frozenset:
+    return _route_set_intern.setdefault(route_ids, route_ids)
+
 def build_hvv_graph(
     stops: pd.DataFrame,
     stop_times: pd.DataFrame,
@@ -58,6 +85,17 @@ def build_hvv_graph(
     - Edges: consecutive stops within each trip.
       Each edge stores a set of route_ids using this segment.
     """
+    # Categorical id columns: the isin filters and the trip sort below then
+    # work on interned int codes instead of hashing a string per row
+    stop_times = stop_times.assign(
+        trip_id=stop_times["trip_id"].astype("category"),
+        stop_id=stop_times["stop_id"].astype("category"),
+    )
+    trips = trips.assign(
+        trip_id=trips["trip_id"].astype("category"),
+        route_id=trips["route_id"].astype("category"),
+    )
+
     # Filter routes by type
     if allowed_route_types is not None:
         routes_sel = routes[routes["route_type"].isin(allowed_route_types)].copy()
@@ -85,62 +123,129 @@ def build_hvv_graph(
         how="left",
     )
 
+    # Parse schedule times for the whole table at once
+    st["arr_s"] = gtfs_times_to_seconds(st["arrival_time"])
+    st["dep_s"] = gtfs_times_to_seconds(st["departure_time"])
+
     # Build graph
     G = nx.Graph()
 
     # Add nodes with attributes
+    # (lat_rad/lon_rad precomputed for the A* Haversine heuristic)
     for _, r in clusters.iterrows():
         G.add_node(
-            r["node_id"],
+            sys.intern(r["node_id"]),
             lat=r["lat"],
             lon=r["lon"],
+            lat_rad=radians(r["lat"]),
+            lon_rad=radians(r["lon"]),
             stop_ids=r["stop_ids"],
             transfer=len(r["stop_ids"]) > 1,
         )
 
-    # Add edges per trip
-    for trip_id, group in st.sort_values(["trip_id", "stop_sequence"]).groupby("trip_id"):
-        group = group.sort_values("stop_sequence")
+    # Add edges per trip: sort once, pull flat NumPy columns and slice each
+    # trip's range instead of groupby + iterrows (no Series built per row)
+    st_sorted = st.sort_values(["trip_id", "stop_sequence"])
+    trip_ids = st_sorted["trip_id"].to_numpy()
+    stop_ids = st_sorted["stop_id"].to_numpy()
+    route_id_col = st_sorted["route_id"].to_numpy()
+    route_type_col = st_sorted["route_type"].to_numpy()
+    arr_s = st_sorted["arr_s"].to_numpy()
+    dep_s = st_sorted["dep_s"].to_numpy()
+
+    boundaries = np.flatnonzero(trip_ids[1:] != trip_ids[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(trip_ids)]))
+
+    # Accumulate edge attributes in a plain dict and add everything to the
+    # graph in one bulk call instead of mutating NetworkX per segment
+    edge_acc: dict[tuple, dict] = {}
+
+    for lo, hi in zip(starts, ends):
         nodes = []
         route_ids = []
         route_types = []
         times = []
-        for _, row in group.iterrows():
-            node = stop_id_to_node.get(row["stop_id"])
+        for k in range(lo, hi):
+            node = stop_id_to_node.get(stop_ids[k])
             if node:
                 nodes.append(node)
-                route_ids.append(row["route_id"])
-                route_types.append(row["route_type"])
-                # add time
-                arrival_time = parse_gtfs_time(row.get("arrival_time", ""))
-                departure_time = parse_gtfs_time(row.get("departure_time", ""))
-                # save to list for use when creating edges
-                times.append((arrival_time, departure_time))
+                route_ids.append(route_id_col[k])
+                route_types.append(route_type_col[k])
+                times.append((arr_s[k], dep_s[k]))
+
+        # time between stops = arrival_next - departure_current; the modulo
+        # wraps past-midnight segments branchlessly for the whole trip at once
+        arr_times = np.fromiter((a for a, _ in times), dtype=np.int64, count=len(times))
+        dep_times = np.fromiter((d for _, d in times), dtype=np.int64, count=len(times))
+        travel = (arr_times[1:] - dep_times[:-1]) % 86400
 
         # Create edges between consecutive nodes
         for i in range(len(nodes) - 1):
             u, v = nodes[i], nodes[i + 1]
             if u != v:
-                # calculate time between stops
-                # time = arrival_time of the next stop - departure_time of the current stop
-                if i + 1 < len(times):
-                    travel_time = times[i + 1][0] - times[i][1]  # arrival_next - departure_current
-                    if travel_time < 0:  # if it crosses midnight
-                        travel_time += 24 * 3600
-                else:
-                    travel_time = 60  # default 1 minute
-                
-                if G.has_edge(u, v):
-                    G[u][v]["route_ids"].add(route_ids[i])
-                    G[u][v]["route_types"].add(route_types[i])
-                    # update time (can take minimum or average)
-                    if "travel_time" not in G[u][v]:
-                        G[u][v]["travel_time"] = []
-                    G[u][v]["travel_time"].append(travel_time)
-                else:
-                    G.add_edge(u, v, 
-                            route_ids={route_ids[i]}, 
-                            route_types={route_types[i]},
-                            travel_time=[travel_time])
+                travel_time = int(travel[i])
+                key = (u, v) if u <= v else (v, u)
+                attrs = edge_acc.get(key)
+                if attrs is None:
+                    attrs = edge_acc[key] = {
+                        "route_ids": set(),
+                        "route_types": set(),
+                        "travel_time": [],
+                    }
+                attrs["route_ids"].add(route_ids[i])
+                attrs["route_types"].add(route_types[i])
+                attrs["travel_time"].append(travel_time)
+
+    # Fix the per-edge minimum once; lookups then skip the O(k) min() scan.
+    # route_ids freeze into interned frozensets shared across edges.
+    for attrs in edge_acc.values():
+        attrs["min_travel_time"] = min(attrs["travel_time"])
+        attrs["route_ids"] = _intern_route_set(frozenset(attrs["route_ids"]))
+
+    G.add_edges_from((u, v, attrs) for (u, v), attrs in edge_acc.items())
+
+    _attach_attribute_arrays(G)
 
     return G, clusters, routes_sel
+
+def _attach_attribute_arrays(G: nx.Graph) -> None:
+    """
+    Store node/edge attributes as parallel NumPy columns on G.graph so hot
+    loops read contiguous arrays instead of walking per-node attribute dicts:
+
+    - node_index: {node: int} mapping into the column arrays
+    - lat / lon: float64 per node
+    - edge_u_idx / edge_v_idx: int32 endpoint indices per edge
+    - min_travel_time: float64 per edge (fastest recorded segment time)
+    - edge_index: {(u, v): int} for both orientations of each edge
+    """
+    n = G.number_of_nodes()
+    m = G.number_of_edges()
+
+    node_index = {node: i for i, node in enumerate(G.nodes())}
+    G.graph['node_index'] = node_index
+    G.graph['lat'] = np.fromiter(
+        (G.nodes[node]['lat'] for node in G.nodes()), dtype=np.float64, count=n)
+    G.graph['lon'] = np.fromiter(
+        (G.nodes[node]['lon'] for node in G.nodes()), dtype=np.float64, count=n)
+
+    edge_u_idx = np.empty(m, dtype=np.int32)
+    edge_v_idx = np.empty(m, dtype=np.int32)
+    min_travel_time = np.empty(m, dtype=np.float64)
+    edge_index = {}
+    for k, (u, v, data) in enumerate(G.edges(data=True)):
+        edge_u_idx[k] = node_index[u]
+        edge_v_idx[k] = node_index[v]
+        if 'min_travel_time' in data:
+            min_travel_time[k] = data['min_travel_time']
+        else:
+            travel_times = data.get('travel_time')
+            min_travel_time[k] = min(travel_times) if travel_times else 60
+        edge_index[(u, v)] = k
+        edge_index[(v, u)] = k
+
+    G.graph['edge_u_idx'] = edge_u_idx
+    G.graph['edge_v_idx'] = edge_v_idx
+    G.graph['min_travel_time'] = min_travel_time
+    G.graph['edge_index'] = edge_index
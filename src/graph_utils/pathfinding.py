@@ -1,12 +1,49 @@
 import networkx as nx
 from typing import Optional
 from collections import deque
+from dataclasses import dataclass
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import breadth_first_order, depth_first_order
+    from .dijkstra import _structure_csr
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+
+def _csgraph_path(G: nx.Graph, start: str, end: str, order_func) -> Optional[list]:
+    """
+    Run a scipy compiled traversal (breadth_first_order/depth_first_order)
+    on the graph's cached structure-only CSR (unit weights - traversals are
+    unweighted by contract) and walk the predecessor array back from end.
+    """
+    indptr, indices, data, nodes, node_to_idx = _structure_csr(G)
+    csr = csr_matrix((data, indices, indptr), shape=(len(nodes), len(nodes)))
+    start_idx = node_to_idx[start]
+    end_idx = node_to_idx[end]
+
+    _, predecessors = order_func(csr, start_idx, directed=True,
+                                 return_predecessors=True)
+
+    path = []
+    current = end_idx
+    while current != start_idx:
+        if current < 0:  # scipy marks unreachable nodes with -9999
+            return None
+        path.append(nodes[current])
+        current = predecessors[current]
+    path.append(nodes[start_idx])
+    path.reverse()
+    return path
+
 
 def dfs_path(G: nx.Graph, start: str, end: str) -> Optional[list]:
     """
     Depth-First Search path (not guaranteed shortest).
 
-    Uses:
+    Uses scipy's compiled depth_first_order when available; the pure-Python
+    traversal below is the fallback:
         - stack (LIFO)
         - visited set
         - parent dict for path reconstruction
@@ -14,6 +51,9 @@ def dfs_path(G: nx.Graph, start: str, end: str) -> Optional[list]:
     if start not in G or end not in G:
         return None
 
+    if HAS_SCIPY:
+        return _csgraph_path(G, start, end, depth_first_order)
+
     stack = [start]
     visited = {start}
     parent = {start: None}
@@ -44,7 +84,8 @@ def bfs_path(G: nx.Graph, start: str, end: str) -> Optional[list]:
     """
     Breadth-First Search path (unweighted shortest path by number of edges).
 
-    Uses:
+    Uses scipy's compiled breadth_first_order when available; the pure-Python
+    traversal below is the fallback:
         - queue (FIFO)
         - visited set
         - parent dict for path reconstruction
@@ -52,6 +93,9 @@ def bfs_path(G: nx.Graph, start: str, end: str) -> Optional[list]:
     if start not in G or end not in G:
         return None
 
+    if HAS_SCIPY:
+        return _csgraph_path(G, start, end, breadth_first_order)
+
     queue = deque([start])
     visited = {start}
     parent = {start: None}
@@ -78,35 +122,50 @@ def bfs_path(G: nx.Graph, start: str, end: str) -> Optional[list]:
     return None  # no path
 
 
-def compare_paths(path1: Optional[list], path2: Optional[list], G: nx.Graph) -> dict:
+@dataclass(slots=True)
+class PathComparison:
+    """
+    Result of comparing two paths (e.g., DFS vs BFS). Slotted, so building
+    one inside a hot comparison loop skips the per-instance __dict__.
+    """
+    path1: Optional[list]
+    path2: Optional[list]
+    path1_length: Optional[int]
+    path2_length: Optional[int]
+    path1_edges: Optional[int]
+    path2_edges: Optional[int]
+    length_difference: Optional[int]
+    same_path: bool
+    path1_exists: bool
+    path2_exists: bool
+
+
+def compare_paths(path1: Optional[list], path2: Optional[list], G: nx.Graph) -> PathComparison:
     """
     Compare two paths and return statistics.
-    
+
     Args:
         path1: First path (e.g., from DFS)
         path2: Second path (e.g., from BFS)
         G: Graph for additional analysis
-    
+
     Returns:
-        Dictionary with comparison results
+        PathComparison with the comparison results
     """
-    result = {
-        "path1_length": len(path1) if path1 else None,
-        "path2_length": len(path2) if path2 else None,
-        "path1": path1,
-        "path2": path2,
-        "same_path": path1 == path2 if (path1 and path2) else False,
-        "path1_exists": path1 is not None,
-        "path2_exists": path2 is not None,
-    }
-    
-    if path1 and path2:
-        result["length_difference"] = len(path1) - len(path2)
-        result["path1_edges"] = len(path1) - 1
-        result["path2_edges"] = len(path2) - 1
-    else:
-        result["length_difference"] = None
-        result["path1_edges"] = None
-        result["path2_edges"] = None
-    
-    return result
\ No newline at end of file
+    # lengths computed once; edge counts only when both paths exist
+    length1 = len(path1) if path1 else None
+    length2 = len(path2) if path2 else None
+    both = bool(path1 and path2)
+
+    return PathComparison(
+        path1=path1,
+        path2=path2,
+        path1_length=length1,
+        path2_length=length2,
+        path1_edges=length1 - 1 if both else None,
+        path2_edges=length2 - 1 if both else None,
+        length_difference=length1 - length2 if both else None,
+        same_path=(length1 == length2 and path1 == path2) if both else False,
+        path1_exists=path1 is not None,
+        path2_exists=path2 is not None,
+    )
\ No newline at end of file
@@ -1,6 +1,9 @@
+from collections import defaultdict
+
 import networkx as nx
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection
 import pandas as pd
 import numpy as np
 
@@ -10,23 +13,122 @@ def make_route_color_map(routes: pd.DataFrame, default="#999999") -> dict:
     Map route_id -> matplotlib color string.
     GTFS route_color is hex without leading '#'.
     """
-    color_map = {}
-    for _, row in routes.iterrows():
-        route_id = row["route_id"]
-        col = row.get("route_color", "")
-        
-        # Check for NaN or empty values
-        if pd.isna(col) or (isinstance(col, str) and col.strip() == ""):
-            color_map[route_id] = default
-            continue
-            
-        col = str(col).strip()
-        # Validate hex color format (3 or 6 hex digits)
-        if len(col) in (3, 6) and all(c in "0123456789ABCDEFabcdef" for c in col):
-            color_map[route_id] = "#" + col
-        else:
-            color_map[route_id] = default
-    return color_map
+    if "route_color" not in routes.columns:
+        return {route_id: default for route_id in routes["route_id"]}
+
+    # One vectorized regex validates all colors (3 or 6 hex digits) at once;
+    # np.where assembles the final strings without a Python-level loop
+    col = routes["route_color"].fillna("").astype(str).str.strip()
+    valid = col.str.match(r"[0-9A-Fa-f]{3}(?:[0-9A-Fa-f]{3})?$").to_numpy()
+    colors = np.where(valid, "#" + col, default)
+    return dict(zip(routes["route_id"].to_numpy(), colors))
+
+def _compact_routes(routes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast the routes table once at the plotting boundary: route_id as
+    category (isin/equality run on integer codes), the name and color
+    columns as pandas string dtype, route_type as int16. The converted
+    frame is memoized on routes.attrs so repeated renders reuse it.
+    """
+    cached = routes.attrs.get("_compact_routes")
+    if cached is not None:
+        return cached
+
+    conversions = {}
+    if "route_id" in routes.columns:
+        conversions["route_id"] = "category"
+    for col in ("route_short_name", "route_long_name", "route_color"):
+        if col in routes.columns:
+            conversions[col] = "string"
+    if "route_type" in routes.columns:
+        conversions["route_type"] = "int16"
+
+    compact = routes.astype(conversions)
+    routes.attrs["_compact_routes"] = compact
+    return compact
+
+def _routes_name_map(routes: pd.DataFrame) -> dict:
+    """
+    Map route_id -> display name: route_short_name, else route_long_name
+    (truncated to 30 chars), else the route_id itself.
+    Built with vectorized column ops and memoized on routes.attrs so
+    repeated renders over the same DataFrame reuse one dict.
+    """
+    cached = routes.attrs.get("_route_name_map")
+    if cached is not None:
+        return cached
+
+    rids = routes["route_id"]
+    names = rids.astype(str)
+    if "route_long_name" in routes.columns:
+        long_names = routes["route_long_name"].fillna("").astype(str).str.slice(0, 30)
+        names = long_names.where(long_names != "", names)
+    if "route_short_name" in routes.columns:
+        short_names = routes["route_short_name"].fillna("").astype(str)
+        names = short_names.where(short_names != "", names)
+
+    name_map = dict(zip(rids, names))
+    routes.attrs["_route_name_map"] = name_map
+    return name_map
+
+def _pos_arrays(G: nx.Graph) -> tuple[list, dict, np.ndarray, np.ndarray]:
+    """
+    Geographic node positions as SoA arrays (nodes, node_idx, xs, ys),
+    cached on G.graph['_pos_cache'] so repeated renders skip the per-node
+    attribute-dict walks.
+    """
+    cached = G.graph.get("_pos_cache")
+    if cached is not None:
+        return cached
+
+    nodes = list(G.nodes)
+    n = len(nodes)
+    node_idx = {node: i for i, node in enumerate(nodes)}
+    xs = np.fromiter((G.nodes[node]["lon"] for node in nodes), np.float64, count=n)
+    ys = np.fromiter((G.nodes[node]["lat"] for node in nodes), np.float64, count=n)
+
+    cached = (nodes, node_idx, xs, ys)
+    G.graph["_pos_cache"] = cached
+    return cached
+
+def _edge_cache(G: nx.Graph) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Edge endpoints and per-edge route-id frozensets as parallel arrays,
+    cached on G.graph['_edge_cache']. Render passes then reuse one walk
+    of the NetworkX adjacency dicts instead of re-iterating
+    G.edges(data=True) each time.
+    """
+    cached = G.graph.get("_edge_cache")
+    if cached is not None:
+        return cached
+
+    us, vs, rids = [], [], []
+    for u, v, data in G.edges(data=True):
+        us.append(u)
+        vs.append(v)
+        r = data.get("route_ids", ())
+        # route_ids come interned from the graph build; keep the shared
+        # object instead of allocating a copy
+        rids.append(r if isinstance(r, frozenset) else frozenset(r))
+
+    cached = (np.array(us, dtype=object), np.array(vs, dtype=object),
+              np.array(rids, dtype=object))
+    G.graph["_edge_cache"] = cached
+    return cached
+
+_BEZIER_BASES: dict[int, np.ndarray] = {}
+
+def _bezier_basis(n_samples: int) -> np.ndarray:
+    """
+    Quadratic Bezier basis matrix (n_samples, 3), built once per distinct
+    sample count and reused across renders.
+    """
+    basis = _BEZIER_BASES.get(n_samples)
+    if basis is None:
+        t = np.linspace(0, 1, n_samples)
+        basis = np.stack([(1 - t)**2, 2 * (1 - t) * t, t**2], axis=1)
+        _BEZIER_BASES[n_samples] = basis
+    return basis
 
 def plot_hvv_graph(
     G: nx.Graph,
@@ -40,98 +142,126 @@ def plot_hvv_graph(
     """
     Draw graph with curved edges for parallel routes and legend.
     """
-    # Positions
+    routes = _compact_routes(routes)
+
+    # Positions as SoA arrays indexed by integer node id
     if use_geo_coords:
-        pos = {n: (G.nodes[n]["lon"], G.nodes[n]["lat"]) for n in G.nodes}
+        nodes, node_idx, xs, ys = _pos_arrays(G)
     else:
-        pos = nx.spring_layout(G, seed=42, k=0.3)
+        nodes = list(G.nodes)
+        node_idx = {node: i for i, node in enumerate(nodes)}
+        layout = nx.spring_layout(G, seed=42, k=0.3)
+        xs = np.fromiter((layout[node][0] for node in nodes), np.float64, count=len(nodes))
+        ys = np.fromiter((layout[node][1] for node in nodes), np.float64, count=len(nodes))
+
+    edge_us, edge_vs, edge_rids = _edge_cache(G)
 
     # Route colors only for actually used routes
     if route_ids is None:
-        route_ids = sorted({
-            rid
-            for _, _, data in G.edges(data=True)
-            for rid in data.get("route_ids", [])
-        })
+        route_ids = sorted({rid for rids in edge_rids for rid in rids})
 
     routes_for_plot = routes[routes["route_id"].isin(route_ids)].copy()
     route_color = make_route_color_map(routes_for_plot)
     
-    # Create route name mapping for legend
-    route_names = {}
-    for _, row in routes_for_plot.iterrows():
-        route_id = row["route_id"]
-        route_short_name = row.get("route_short_name", "")
-        route_long_name = row.get("route_long_name", "")
-        if route_short_name and not pd.isna(route_short_name):
-            route_names[route_id] = str(route_short_name)
-        elif route_long_name and not pd.isna(route_long_name):
-            route_names[route_id] = str(route_long_name)[:30]
-        else:
-            route_names[route_id] = route_id
+    # Route name mapping for the legend (memoized on the DataFrame)
+    route_names = _routes_name_map(routes)
 
     plt.figure(figsize=(14, 10))
     ax = plt.gca()
     plt.title(title, fontsize=14, pad=20)
 
-    # Group edges by (u, v) to detect parallel routes
+    # Edge endpoint indices and geometry for all edges in one shot
+    n_edges = len(edge_us)
+    u_idx = np.fromiter((node_idx[u] for u in edge_us), np.int64, count=n_edges)
+    v_idx = np.fromiter((node_idx[v] for v in edge_vs), np.int64, count=n_edges)
+    edge_dx = xs[v_idx] - xs[u_idx]
+    edge_dy = ys[v_idx] - ys[u_idx]
+    edge_len = np.hypot(edge_dx, edge_dy)
+
+    # Group edges by (u, v) to detect parallel routes, and invert the
+    # route->edges relation in the same pass so the drawing loop below
+    # does not rescan every edge per route. Each edge key maps
+    # rid -> insertion rank, making the offset lookup O(1). Keys pack the
+    # sorted endpoint indices into one int - no list/sort/tuple per edge.
     edge_routes = {}
-    for u, v, data in G.edges(data=True):
-        edge_key = tuple(sorted([u, v]))
-        if edge_key not in edge_routes:
-            edge_routes[edge_key] = []
-        edge_routes[edge_key].extend(list(data.get("route_ids", set())))
+    route_to_edges = defaultdict(list)
+    for k in range(n_edges):
+        iu, iv = int(u_idx[k]), int(v_idx[k])
+        edge_key = (iu << 32) | iv if iu < iv else (iv << 32) | iu
+        ranks = edge_routes.setdefault(edge_key, {})
+        for rid in edge_rids[k]:
+            if rid not in ranks:
+                ranks[rid] = len(ranks)
+            route_to_edges[rid].append(k)
 
     # Draw edges per route with curves for parallel routes
     legend_handles = []
     drawn_edges = set()  # Track drawn edges to avoid duplicates
-    
+
     for idx, rid in enumerate(route_ids):
-        edges_for_route = [
-            (u, v)
-            for u, v, data in G.edges(data=True)
-            if rid in data.get("route_ids", set())
-        ]
+        edges_for_route = route_to_edges.get(rid)
         if not edges_for_route:
             continue
 
         color = route_color.get(rid, "#999999")
-        
-        for u, v in edges_for_route:
-            edge_key = tuple(sorted([u, v]))
+
+        straight = []       # edge indices drawn as plain segments
+        curved = []         # edge indices needing a curve
+        control_points = []  # (3, 2) Bezier control points per curved edge
+
+        for k in edges_for_route:
+            iu, iv = int(u_idx[k]), int(v_idx[k])
+            edge_key = (iu << 32) | iv if iu < iv else (iv << 32) | iu
             parallel_routes = edge_routes[edge_key]
-            route_index = parallel_routes.index(rid) if rid in parallel_routes else 0
-            num_parallel = len(set(parallel_routes))
-            
-            x1, y1 = pos[u]
-            x2, y2 = pos[v]
-            
-            # Calculate perpendicular offset for curve
-            dx = x2 - x1
-            dy = y2 - y1
-            length = np.sqrt(dx**2 + dy**2)
-            
+            route_index = parallel_routes.get(rid, 0)
+            num_parallel = len(parallel_routes)
+
+            x1, y1 = xs[u_idx[k]], ys[u_idx[k]]
+            x2, y2 = xs[v_idx[k]], ys[v_idx[k]]
+            length = edge_len[k]
+
             if length > 0 and num_parallel > 1:
                 # Perpendicular vector
-                perp_x = -dy / length
-                perp_y = dx / length
-                
+                perp_x = -edge_dy[k] / length
+                perp_y = edge_dx[k] / length
+
                 # Offset based on route index
                 offset = (route_index - (num_parallel - 1) / 2) * curve_radius
-                
+
                 # Control point for quadratic curve (midpoint with offset)
                 mid_x = (x1 + x2) / 2 + perp_x * offset
                 mid_y = (y1 + y2) / 2 + perp_y * offset
-                
-                # Draw curved line
-                t = np.linspace(0, 1, 50)
-                curve_x = (1 - t)**2 * x1 + 2 * (1 - t) * t * mid_x + t**2 * x2
-                curve_y = (1 - t)**2 * y1 + 2 * (1 - t) * t * mid_y + t**2 * y2
-                
-                ax.plot(curve_x, curve_y, color=color, linewidth=1.8, alpha=0.9, zorder=1)
+
+                control_points.append(((x1, y1), (mid_x, mid_y), (x2, y2)))
+                curved.append(k)
             else:
-                # Straight line for single route
-                ax.plot([x1, x2], [y1, y2], color=color, linewidth=1.8, alpha=0.9, zorder=1)
+                straight.append(k)
+
+        # One LineCollection per route: a single artist instead of one
+        # Line2D per edge
+        segments = []
+        if control_points:
+            # Sample count scales with on-screen edge length: short
+            # segments get 8 points, long ones up to 32. Edges are
+            # bucketed by count so each bucket is one basis multiplication
+            cps = np.asarray(control_points)  # (E, 3, 2)
+            n_samples = np.clip(
+                (edge_len[np.asarray(curved)] / curve_radius * 0.5).astype(int),
+                8, 32)
+            for ns in np.unique(n_samples):
+                curves = np.einsum('tk,ekc->etc', _bezier_basis(int(ns)),
+                                   cps[n_samples == ns])  # (E', ns, 2)
+                segments.extend(curves)
+        if straight:
+            k = np.asarray(straight)
+            segments.extend(np.stack([
+                np.column_stack((xs[u_idx[k]], ys[u_idx[k]])),
+                np.column_stack((xs[v_idx[k]], ys[v_idx[k]])),
+            ], axis=1))  # (S, 2, 2)
+
+        ax.add_collection(LineCollection(
+            segments, colors=color, linewidths=1.8, alpha=0.9, zorder=1,
+        ))
 
         # Add to legend (only once per route)
         if rid not in drawn_edges:
@@ -140,23 +270,18 @@ def plot_hvv_graph(
             )
             drawn_edges.add(rid)
 
-    # Nodes: transfer vs regular
-    transfer_nodes = [n for n, d in G.nodes(data=True) if d.get("transfer", False)]
-    regular_nodes = [n for n in G.nodes if n not in transfer_nodes]
-
-    nx.draw_networkx_nodes(
-        G, pos, nodelist=regular_nodes,
-        node_size=25, node_color="#1f78b4", alpha=0.9,
-    )
-    nx.draw_networkx_nodes(
-        G, pos, nodelist=transfer_nodes,
-        node_size=80, node_color="#ff7f00", alpha=0.95,
-    )
-    nx.draw_networkx_labels(
-        G, pos,
-        labels={n: n for n in transfer_nodes},
-        font_size=6,
-    )
+    # Nodes: transfer vs regular, scattered straight from the coordinate
+    # arrays (skips networkx's own per-node attribute extraction)
+    transfer_mask = np.fromiter(
+        (G.nodes[node].get("transfer", False) for node in nodes),
+        bool, count=len(nodes))
+
+    ax.scatter(xs[~transfer_mask], ys[~transfer_mask],
+               s=25, c="#1f78b4", alpha=0.9, zorder=2)
+    ax.scatter(xs[transfer_mask], ys[transfer_mask],
+               s=80, c="#ff7f00", alpha=0.95, zorder=2)
+    for i in np.flatnonzero(transfer_mask):
+        ax.text(xs[i], ys[i], nodes[i], fontsize=6, ha="center", va="center")
 
     # Add legend
     if show_legend and legend_handles:
@@ -202,47 +327,42 @@ def build_route_segments(
     """
     if not path or len(path) < 2:
         return ["Path not found"]
-    
-    # create a dictionary route_id -> route_short_name
-    route_names = {}
-    for _, row in routes.iterrows():
-        route_id = row["route_id"]
-        route_short_name = row.get("route_short_name", "")
-        if route_short_name and not pd.isna(route_short_name):
-            route_names[route_id] = str(route_short_name)
-        else:
-            route_names[route_id] = route_id
-    
+
+    # route_id -> display name, shared and memoized across helpers
+    route_names = _routes_name_map(_compact_routes(routes))
+
     segments = []
+    # frozenset(route_ids) -> sorted name tuple; the route set rarely
+    # changes between consecutive edges, so names are sorted once per
+    # distinct set instead of once per edge
+    name_cache: dict[frozenset, tuple[str, ...]] = {}
     current_routes = None
     current_route_names = None
     segment_start = path[0]
-    
+
     for i in range(len(path) - 1):
         u, v = path[i], path[i + 1]
-        
+
         if G.has_edge(u, v):
-            edge_routes = G[u][v].get("route_ids", set())
-            
-            # get route names
-            route_names_list = sorted([
-                route_names.get(rid, str(rid)) 
-                for rid in edge_routes
-            ])
-            
-            # if the route changed, this is a transfer - finish current segment and start new
-            if current_routes is not None and edge_routes != current_routes:
-                # finish current segment: segment_start - line - u
-                line_str = ", ".join(current_route_names)
-                segments.append(f"{segment_start} - {line_str} - {u}")
-                # start new segment from transfer station
-                segment_start = u
-                current_routes = edge_routes
-                current_route_names = route_names_list
-            elif current_routes is None:
-                # first segment: start tracking
+            edge_routes = G[u][v].get("route_ids", frozenset())
+            if not isinstance(edge_routes, frozenset):
+                edge_routes = frozenset(edge_routes)
+
+            # interned sets make the no-change case a pointer compare
+            if edge_routes is not current_routes and edge_routes != current_routes:
+                # if the route changed, this is a transfer - finish
+                # current segment and start new
+                if current_routes is not None:
+                    line_str = ", ".join(current_route_names)
+                    segments.append(f"{segment_start} - {line_str} - {u}")
+                    segment_start = u
+                names = name_cache.get(edge_routes)
+                if names is None:
+                    names = name_cache[edge_routes] = tuple(sorted(
+                        route_names.get(rid, str(rid)) for rid in edge_routes
+                    ))
                 current_routes = edge_routes
-                current_route_names = route_names_list
+                current_route_names = names
         else:
             # if the edge is not present, finish current segment if any
             if current_routes is not None:
@@ -262,6 +382,25 @@ def build_route_segments(
     
     return segments
 
+def _transfer_stations(G: nx.Graph, path: list) -> set:
+    """
+    Stations along a path where the serving route set changes (transfers):
+    one pass over consecutive edges comparing their route_ids sets.
+    """
+    out = set()
+    prev = None
+    for u, v in zip(path, path[1:]):
+        if not G.has_edge(u, v):
+            prev = None
+            continue
+        edge_routes = G[u][v].get("route_ids", frozenset())
+        # interned frozensets from the graph build: identity rules out
+        # the common unchanged case before the O(k) set compare
+        if prev is not None and edge_routes is not prev and edge_routes != prev:
+            out.add(u)
+        prev = edge_routes
+    return out
+
 def plot_paths_comparison(
     G: nx.Graph,
     routes: pd.DataFrame,
@@ -278,9 +417,10 @@ def plot_paths_comparison(
     import matplotlib.pyplot as plt
     import numpy as np
     
-    # get positions
+    # get positions (cached coordinate arrays when geographic)
     if use_geo_coords:
-        pos = {n: (G.nodes[n]["lon"], G.nodes[n]["lat"]) for n in G.nodes}
+        nodes, _, xs, ys = _pos_arrays(G)
+        pos = {node: (xs[i], ys[i]) for i, node in enumerate(nodes)}
     else:
         pos = nx.spring_layout(G, seed=42, k=0.3)
     
@@ -288,77 +428,45 @@ def plot_paths_comparison(
     fig, ax = plt.subplots(figsize=(14, 10))
     plt.title(title, fontsize=14, pad=20)
     
-    # draw all edges of the graph (light-gray)
-    for u, v in G.edges():
-        x1, y1 = pos[u]
-        x2, y2 = pos[v]
-        ax.plot([x1, x2], [y1, y2], 
-                color='lightgray', linewidth=0.5, alpha=0.3, zorder=1)
-    
+    # draw all edges of the graph (light-gray) as one collection,
+    # endpoints taken from the cached edge arrays
+    edge_us, edge_vs, _ = _edge_cache(G)
+    background = [(pos[u], pos[v]) for u, v in zip(edge_us, edge_vs)]
+    ax.add_collection(LineCollection(
+        background, colors='lightgray', linewidths=0.5, alpha=0.3, zorder=1,
+    ))
+
     # draw DFS path (blue)
     if dfs_path and len(dfs_path) > 1:
-        for i in range(len(dfs_path) - 1):
-            u, v = dfs_path[i], dfs_path[i + 1]
-            if u in pos and v in pos:
-                x1, y1 = pos[u]
-                x2, y2 = pos[v]
-                ax.plot([x1, x2], [y1, y2], 
-                        color='blue', linewidth=3, alpha=0.7, 
-                        label='DFS Path' if i == 0 else '', zorder=2)
-    
+        segments = [(pos[u], pos[v])
+                    for u, v in zip(dfs_path, dfs_path[1:])
+                    if u in pos and v in pos]
+        ax.add_collection(LineCollection(
+            segments, colors='blue', linewidths=3, alpha=0.7,
+            label='DFS Path', zorder=2,
+        ))
+
     # draw BFS path (red)
     if bfs_path and len(bfs_path) > 1:
-        for i in range(len(bfs_path) - 1):
-            u, v = bfs_path[i], bfs_path[i + 1]
-            if u in pos and v in pos:
-                x1, y1 = pos[u]
-                x2, y2 = pos[v]
-                ax.plot([x1, x2], [y1, y2], 
-                        color='red', linewidth=3, alpha=0.7,
-                        linestyle='--', 
-                        label='BFS Path' if i == 0 else '', zorder=3)
-    
-    # find transfer stations (where route changes)
-    def find_transfer_stations(G, path, routes):
-        """Find stations where route changes (transfers)."""
-        if not path or len(path) < 2:
-            return set()
-        
-        # create route names dictionary
-        route_names = {}
-        for _, row in routes.iterrows():
-            route_id = row["route_id"]
-            route_short_name = row.get("route_short_name", "")
-            if route_short_name and not pd.isna(route_short_name):
-                route_names[route_id] = str(route_short_name)
-            else:
-                route_names[route_id] = route_id
-        
-        transfer_stations = set()
-        current_routes = None
-        
-        for i in range(len(path) - 1):
-            u, v = path[i], path[i + 1]
-            if G.has_edge(u, v):
-                edge_routes = G[u][v].get("route_ids", set())
-                # if route changed, u is a transfer station
-                if current_routes is not None and edge_routes != current_routes:
-                    transfer_stations.add(u)
-                current_routes = edge_routes
-        
-        return transfer_stations
+        segments = [(pos[u], pos[v])
+                    for u, v in zip(bfs_path, bfs_path[1:])
+                    if u in pos and v in pos]
+        ax.add_collection(LineCollection(
+            segments, colors='red', linewidths=3, alpha=0.7,
+            linestyles='--', label='BFS Path', zorder=3,
+        ))
     
     # collect all path nodes
     all_path_nodes = set()
     transfer_stations = set()
-    
+
     if dfs_path:
         all_path_nodes.update(dfs_path)
-        transfer_stations.update(find_transfer_stations(G, dfs_path, routes))
-    
+        transfer_stations.update(_transfer_stations(G, dfs_path))
+
     if bfs_path:
         all_path_nodes.update(bfs_path)
-        transfer_stations.update(find_transfer_stations(G, bfs_path, routes))
+        transfer_stations.update(_transfer_stations(G, bfs_path))
     
     # regular nodes (not in path)
     regular_nodes = [n for n in G.nodes() if n not in all_path_nodes]
@@ -61,10 +61,10 @@ def main():
     comparison = compare_paths(dfs_result, bfs_result, G)
     print("\n" + "=" * 60)
     print("Comparison of paths:")
-    print(f"  DFS length: {comparison['path1_length']}")
-    print(f"  BFS length: {comparison['path2_length']}")
-    print(f"  Difference: {comparison['length_difference']}")
-    print(f"  Same paths: {comparison['same_path']}")
+    print(f"  DFS length: {comparison.path1_length}")
+    print(f"  BFS length: {comparison.path2_length}")
+    print(f"  Difference: {comparison.length_difference}")
+    print(f"  Same paths: {comparison.same_path}")
     
     # explain differences
     print("\n" + "=" * 60)
@@ -81,11 +81,11 @@ def main():
     print("  - Guarantees the shortest path by number of edges (for an unweighted graph)")
     print("  - Always finds a path with the minimum number of transitions")
     
-    if comparison['path1_length'] and comparison['path2_length']:
-        if comparison['path1_length'] > comparison['path2_length']:
-            print(f"\nIn this case, DFS found a longer path by {comparison['length_difference']} stations, "
+    if comparison.path1_length and comparison.path2_length:
+        if comparison.path1_length > comparison.path2_length:
+            print(f"\nIn this case, DFS found a longer path by {comparison.length_difference} stations, "
                   f"because it went down the first available branch, which turned out to be not the shortest.")
-        elif comparison['path1_length'] < comparison['path2_length']:
+        elif comparison.path1_length < comparison.path2_length:
             print(f"\nIn this case, DFS accidentally found a shorter path, "
                   f"but this is not guaranteed by the algorithm.")
         else:
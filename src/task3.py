@@ -9,8 +9,10 @@ from pathlib import Path
 from graph_utils.data_loader import load_gtfs_tables, HVV_DATA
 from graph_utils.graph_builder import build_hvv_graph
 
-from graph_utils.dijkstra import add_edge_weights, dijkstra_shortest_path, all_pairs_shortest_paths
+from graph_utils.dijkstra import add_edge_weights, dijkstra_shortest_path, all_pairs_distance_stats
 from graph_utils.dijkstra import geographic_distance, travel_time_weight
+from graph_utils.backends import HAS_IGRAPH
+from graph_utils.backends import all_pairs_distance_stats as igraph_distance_stats
 
 def format_time(seconds: float) -> str:
     """Format seconds to human-readable time."""
@@ -117,26 +119,24 @@ def main():
     print("=" * 70)
     
     print("\n📊 Calculating all pairs of paths...")
-    all_paths = all_pairs_shortest_paths(G_weighted)
-    print(f"\n✓ Found {len(all_paths)} unique pairs of paths")
-     
-    # Statistics
-    if all_paths:
-        distances = []
-        for (start, end), (path, distance) in all_paths.items():
-            if path and distance != float('inf'):
-                distances.append(distance)
-        
-        if distances:
-            print(f"\n📊 Statistics of distances:")
-            print(f"  Minimum: {format_value(min(distances))}")
-            print(f"  Maximum: {format_value(max(distances))}")
-            print(f"  Average: {format_value(sum(distances) / len(distances))}")
-            print(f"  Total pairs: {len(distances)}")
-        else:
-            print("\n⚠️  No valid paths found in statistics")
+    # both backends return the same stats dict from a C-computed distance
+    # matrix; individual paths are never reconstructed for the statistics
+    if HAS_IGRAPH:
+        stats = igraph_distance_stats(G_weighted)
+        backend = "igraph"
+    else:
+        stats = all_pairs_distance_stats(G_weighted)
+        backend = "scipy"
+
+    if stats["pairs"]:
+        print(f"\n✓ Found {stats['pairs']} unique pairs of paths ({backend} backend)")
+        print(f"\n📊 Statistics of distances:")
+        print(f"  Minimum: {format_value(stats['min'])}")
+        print(f"  Maximum: {format_value(stats['max'])}")
+        print(f"  Average: {format_value(stats['mean'])}")
+        print(f"  Total pairs: {stats['pairs']}")
     else:
-        print("\n⚠️  No paths calculated")
+        print("\n⚠️  No valid paths found in statistics")
     
     print("\n" + "=" * 70)
     print("Done!")